@@ -0,0 +1,22 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+ABLATION_RC = {
+    "font.size": 11, "axes.titlesize": 11, "axes.labelsize": 11,
+    "xtick.labelsize": 11, "ytick.labelsize": 11, "legend.fontsize": 11
+}
+
+def set_ablation_style():
+    plt.rcParams.update(ABLATION_RC)
+
+def annotate_points(ax, x, y, fmt, color):
+    y_min, y_max = ax.get_ylim()
+    dy = 0.02*(y_max - y_min)
+    up = np.arange(len(x)) % 2 == 0
+    dys = np.where(up, dy, -dy)
+    vas = np.where(up, 'bottom', 'top')
+    labels = [fmt.format(yi) for yi in y]
+    for xi, yi, label, va, dyi in zip(x, y, labels, vas, dys):
+        ax.annotate(label, (xi, yi), ha='center', va=va,
+                    color=color, xytext=(0, dyi),
+                    textcoords='offset points')
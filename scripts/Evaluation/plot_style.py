@@ -0,0 +1,36 @@
+import io
+import os
+
+import matplotlib.pyplot as plt
+
+BALEEN_RC = {
+    "font.size": 11,
+    "axes.titlesize": 11,
+    "axes.labelsize": 11,
+    "legend.fontsize": 10,
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "axes.spines.top": True,
+    "axes.spines.right": True,
+    "axes.linewidth": 1.1,
+    "lines.linewidth": 2.2,
+    "lines.markersize": 6.5,
+    "savefig.dpi": 300,
+    "axes.grid": True,
+    "grid.alpha": 0.22,
+    "grid.linestyle": "--",
+}
+
+def set_baleen_style():
+    plt.rcParams.update(BALEEN_RC)
+
+def savefig(fig, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fig.tight_layout()
+    # Render into memory and hit the filesystem with a single write.
+    buf = io.BytesIO()
+    fig.savefig(buf, format=os.path.splitext(path)[1][1:] or None)
+    plt.close(fig)
+    with open(path, "wb") as f:
+        f.write(buf.getvalue())
+    print("Saved:", path)
@@ -0,0 +1,51 @@
+import os
+import runpy
+import sys
+import traceback
+from multiprocessing import Pool
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FIGURE_SCRIPTS = [
+    "Ablation/figure_1.py",
+    "Ablation/figure_2.py",
+    "Ablation/figure_3.py",
+    "Ablation/figure_5.py",
+    "Evaluation/peak_DT_across_eviction_schemes.py",
+    "Evaluation/median_DT_across_eviction_schemes.py",
+    "Evaluation/cache_hit_rate_across_eviction_schemes.py",
+    "Evaluation/peak_DT_vs_tau_DT.py",
+    "Evaluation/peak_DT_vs_PROTECTED_cap.py",
+]
+
+def run_script(rel_path):
+    path = os.path.join(SCRIPTS_DIR, rel_path)
+    script_dir = os.path.dirname(path)
+    # Scripts resolve their CSVs, helpers and outputs relative to their own
+    # directory, the same as running `python <script>` from there.
+    os.chdir(script_dir)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except BaseException:
+        return rel_path, traceback.format_exc()
+    return rel_path, None
+
+def main():
+    failed = 0
+    # One script per worker process so rcParams set by one figure never leak
+    # into the next.
+    with Pool(processes=min(len(FIGURE_SCRIPTS), os.cpu_count() or 1),
+              maxtasksperchild=1) as pool:
+        for rel_path, err in pool.imap_unordered(run_script, FIGURE_SCRIPTS):
+            if err is None:
+                print("OK:", rel_path)
+            else:
+                failed += 1
+                print("FAILED:", rel_path, file=sys.stderr)
+                print(err, file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())